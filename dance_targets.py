@@ -5,18 +5,32 @@ Manages dance moves, target positions, and timing for the dance game.
 
 import math
 import random
+import numpy as np
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict
+from functools import lru_cache
+from typing import Tuple, Optional, Dict
 from enum import Enum
 
 
+# Bits of DanceTargetManager._hit_mask
+LEFT_BIT = 1
+RIGHT_BIT = 2
+
+# Event flags returned by DanceTargetManager.update
+EVENT_HIT = 1
+EVENT_MISS = 2
+EVENT_COMPLETE = 4
+EVENT_SEQUENCE_COMPLETE = 8
+EVENT_POP = 16
+
+
 class Hand(Enum):
     LEFT = "left"
     RIGHT = "right"
     BOTH = "both"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DanceMove:
     """A single dance move with target positions."""
     name: str
@@ -28,131 +42,162 @@ class DanceMove:
     description: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DanceSequence:
     """A choreographed sequence of dance moves."""
     name: str
-    moves: List[DanceMove]
+    moves: Tuple[DanceMove, ...]
     tempo_bpm: int = 120  # Beats per minute
     difficulty: int = 1  # 1-3 difficulty rating
 
 
+# Sequences are built once at import and shared; treat them as read-only.
+# YMCA - Arms make letter shapes.
+_YMCA = DanceSequence("YMCA", (
+    DanceMove("Y", left_hand_target=(0.3, 0.15), right_hand_target=(0.7, 0.15),
+             description="Arms up in a Y shape!"),
+    DanceMove("M", left_hand_target=(0.25, 0.4), right_hand_target=(0.75, 0.4),
+             description="Hands on shoulders!"),
+    DanceMove("C", left_hand_target=(0.2, 0.3), right_hand_target=(0.5, 0.5),
+             description="Curve to the left!"),
+    DanceMove("A", left_hand_target=(0.35, 0.2), right_hand_target=(0.65, 0.2),
+             description="Hands together above head!"),
+), tempo_bpm=110, difficulty=1)
+
+# Macarena - Classic hand movements.
+_MACARENA = DanceSequence("Macarena", (
+    DanceMove("Arms Out Right", left_hand_target=(0.3, 0.5), right_hand_target=(0.8, 0.5),
+             description="Right arm straight out!"),
+    DanceMove("Arms Out Left", left_hand_target=(0.2, 0.5), right_hand_target=(0.7, 0.5),
+             description="Left arm straight out!"),
+    DanceMove("Flip Right", left_hand_target=(0.3, 0.45), right_hand_target=(0.8, 0.45),
+             description="Flip right hand up!"),
+    DanceMove("Flip Left", left_hand_target=(0.2, 0.45), right_hand_target=(0.7, 0.45),
+             description="Flip left hand up!"),
+    DanceMove("Right to Left Shoulder", left_hand_target=(0.4, 0.35), right_hand_target=(0.35, 0.35),
+             description="Right hand to left shoulder!"),
+    DanceMove("Left to Right Shoulder", left_hand_target=(0.65, 0.35), right_hand_target=(0.6, 0.35),
+             description="Left hand to right shoulder!"),
+    DanceMove("Right to Head", left_hand_target=(0.4, 0.35), right_hand_target=(0.55, 0.2),
+             description="Right hand behind head!"),
+    DanceMove("Left to Head", left_hand_target=(0.45, 0.2), right_hand_target=(0.6, 0.35),
+             description="Left hand behind head!"),
+), tempo_bpm=100, difficulty=2)
+
+# Baby Shark - Chomping hand movements.
+_BABY_SHARK = DanceSequence("Baby Shark", (
+    DanceMove("Baby Chomp", left_hand_target=(0.4, 0.5), right_hand_target=(0.6, 0.5),
+             description="Small chomps with fingers!"),
+    DanceMove("Mommy Chomp", left_hand_target=(0.35, 0.45), right_hand_target=(0.65, 0.45),
+             description="Bigger chomps!"),
+    DanceMove("Daddy Chomp", left_hand_target=(0.3, 0.4), right_hand_target=(0.7, 0.4),
+             description="Big daddy chomps!"),
+    DanceMove("Grandma Chomp", left_hand_target=(0.35, 0.5), right_hand_target=(0.65, 0.5),
+             description="Gentle grandma chomps!"),
+    DanceMove("Swim Away", left_hand_target=(0.2, 0.5), right_hand_target=(0.8, 0.5),
+             description="Swim swim swim!"),
+), tempo_bpm=115, difficulty=1)
+
+# Hokey Pokey - In and out movements.
+_HOKEY_POKEY = DanceSequence("Hokey Pokey", (
+    DanceMove("Right In", left_hand_target=None, right_hand_target=(0.6, 0.5),
+             description="Right hand in!"),
+    DanceMove("Right Out", left_hand_target=None, right_hand_target=(0.85, 0.5),
+             description="Right hand out!"),
+    DanceMove("Right Shake", left_hand_target=None, right_hand_target=(0.7, 0.4),
+             description="Shake it all about!"),
+    DanceMove("Left In", left_hand_target=(0.4, 0.5), right_hand_target=None,
+             description="Left hand in!"),
+    DanceMove("Left Out", left_hand_target=(0.15, 0.5), right_hand_target=None,
+             description="Left hand out!"),
+    DanceMove("Left Shake", left_hand_target=(0.3, 0.4), right_hand_target=None,
+             description="Shake it all about!"),
+    DanceMove("Both Hands Up", left_hand_target=(0.3, 0.2), right_hand_target=(0.7, 0.2),
+             description="Hands up high!"),
+), tempo_bpm=120, difficulty=1)
+
+# Freeze Dance - Random poses to hold.
+_FREEZE_DANCE = DanceSequence("Freeze Dance", (
+    DanceMove("T-Pose", left_hand_target=(0.15, 0.5), right_hand_target=(0.85, 0.5),
+             description="Arms straight out!"),
+    DanceMove("Hands Up", left_hand_target=(0.3, 0.15), right_hand_target=(0.7, 0.15),
+             description="Reach for the sky!"),
+    DanceMove("Airplane", left_hand_target=(0.1, 0.45), right_hand_target=(0.9, 0.55),
+             description="Tilt like an airplane!"),
+    DanceMove("Robot", left_hand_target=(0.35, 0.4), right_hand_target=(0.65, 0.55),
+             description="Robot arms!"),
+    DanceMove("Star", left_hand_target=(0.2, 0.25), right_hand_target=(0.8, 0.25),
+             description="Make a star shape!"),
+    DanceMove("Low Five", left_hand_target=(0.3, 0.7), right_hand_target=(0.7, 0.7),
+             description="Hands down low!"),
+), tempo_bpm=130, difficulty=2)
+
+_ALL_SEQUENCES = (_YMCA, _BABY_SHARK, _HOKEY_POKEY, _MACARENA, _FREEZE_DANCE)
+
+
 class DanceLibrary:
     """Library of kid-friendly dance sequences."""
 
     @staticmethod
     def get_ymca() -> DanceSequence:
         """YMCA - Arms make letter shapes."""
-        moves = [
-            DanceMove("Y", left_hand_target=(0.3, 0.15), right_hand_target=(0.7, 0.15),
-                     description="Arms up in a Y shape!"),
-            DanceMove("M", left_hand_target=(0.25, 0.4), right_hand_target=(0.75, 0.4),
-                     description="Hands on shoulders!"),
-            DanceMove("C", left_hand_target=(0.2, 0.3), right_hand_target=(0.5, 0.5),
-                     description="Curve to the left!"),
-            DanceMove("A", left_hand_target=(0.35, 0.2), right_hand_target=(0.65, 0.2),
-                     description="Hands together above head!"),
-        ]
-        return DanceSequence("YMCA", moves, tempo_bpm=110, difficulty=1)
+        return _YMCA
 
     @staticmethod
     def get_macarena() -> DanceSequence:
         """Macarena - Classic hand movements."""
-        moves = [
-            DanceMove("Arms Out Right", left_hand_target=(0.3, 0.5), right_hand_target=(0.8, 0.5),
-                     description="Right arm straight out!"),
-            DanceMove("Arms Out Left", left_hand_target=(0.2, 0.5), right_hand_target=(0.7, 0.5),
-                     description="Left arm straight out!"),
-            DanceMove("Flip Right", left_hand_target=(0.3, 0.45), right_hand_target=(0.8, 0.45),
-                     description="Flip right hand up!"),
-            DanceMove("Flip Left", left_hand_target=(0.2, 0.45), right_hand_target=(0.7, 0.45),
-                     description="Flip left hand up!"),
-            DanceMove("Right to Left Shoulder", left_hand_target=(0.4, 0.35), right_hand_target=(0.35, 0.35),
-                     description="Right hand to left shoulder!"),
-            DanceMove("Left to Right Shoulder", left_hand_target=(0.65, 0.35), right_hand_target=(0.6, 0.35),
-                     description="Left hand to right shoulder!"),
-            DanceMove("Right to Head", left_hand_target=(0.4, 0.35), right_hand_target=(0.55, 0.2),
-                     description="Right hand behind head!"),
-            DanceMove("Left to Head", left_hand_target=(0.45, 0.2), right_hand_target=(0.6, 0.35),
-                     description="Left hand behind head!"),
-        ]
-        return DanceSequence("Macarena", moves, tempo_bpm=100, difficulty=2)
+        return _MACARENA
 
     @staticmethod
     def get_baby_shark() -> DanceSequence:
         """Baby Shark - Chomping hand movements."""
-        moves = [
-            DanceMove("Baby Chomp", left_hand_target=(0.4, 0.5), right_hand_target=(0.6, 0.5),
-                     description="Small chomps with fingers!"),
-            DanceMove("Mommy Chomp", left_hand_target=(0.35, 0.45), right_hand_target=(0.65, 0.45),
-                     description="Bigger chomps!"),
-            DanceMove("Daddy Chomp", left_hand_target=(0.3, 0.4), right_hand_target=(0.7, 0.4),
-                     description="Big daddy chomps!"),
-            DanceMove("Grandma Chomp", left_hand_target=(0.35, 0.5), right_hand_target=(0.65, 0.5),
-                     description="Gentle grandma chomps!"),
-            DanceMove("Swim Away", left_hand_target=(0.2, 0.5), right_hand_target=(0.8, 0.5),
-                     description="Swim swim swim!"),
-        ]
-        return DanceSequence("Baby Shark", moves, tempo_bpm=115, difficulty=1)
+        return _BABY_SHARK
 
     @staticmethod
     def get_hokey_pokey() -> DanceSequence:
         """Hokey Pokey - In and out movements."""
-        moves = [
-            DanceMove("Right In", left_hand_target=None, right_hand_target=(0.6, 0.5),
-                     description="Right hand in!"),
-            DanceMove("Right Out", left_hand_target=None, right_hand_target=(0.85, 0.5),
-                     description="Right hand out!"),
-            DanceMove("Right Shake", left_hand_target=None, right_hand_target=(0.7, 0.4),
-                     description="Shake it all about!"),
-            DanceMove("Left In", left_hand_target=(0.4, 0.5), right_hand_target=None,
-                     description="Left hand in!"),
-            DanceMove("Left Out", left_hand_target=(0.15, 0.5), right_hand_target=None,
-                     description="Left hand out!"),
-            DanceMove("Left Shake", left_hand_target=(0.3, 0.4), right_hand_target=None,
-                     description="Shake it all about!"),
-            DanceMove("Both Hands Up", left_hand_target=(0.3, 0.2), right_hand_target=(0.7, 0.2),
-                     description="Hands up high!"),
-        ]
-        return DanceSequence("Hokey Pokey", moves, tempo_bpm=120, difficulty=1)
+        return _HOKEY_POKEY
 
     @staticmethod
     def get_freeze_dance() -> DanceSequence:
         """Freeze Dance - Random poses to hold."""
-        moves = [
-            DanceMove("T-Pose", left_hand_target=(0.15, 0.5), right_hand_target=(0.85, 0.5),
-                     description="Arms straight out!"),
-            DanceMove("Hands Up", left_hand_target=(0.3, 0.15), right_hand_target=(0.7, 0.15),
-                     description="Reach for the sky!"),
-            DanceMove("Airplane", left_hand_target=(0.1, 0.45), right_hand_target=(0.9, 0.55),
-                     description="Tilt like an airplane!"),
-            DanceMove("Robot", left_hand_target=(0.35, 0.4), right_hand_target=(0.65, 0.55),
-                     description="Robot arms!"),
-            DanceMove("Star", left_hand_target=(0.2, 0.25), right_hand_target=(0.8, 0.25),
-                     description="Make a star shape!"),
-            DanceMove("Low Five", left_hand_target=(0.3, 0.7), right_hand_target=(0.7, 0.7),
-                     description="Hands down low!"),
-        ]
-        return DanceSequence("Freeze Dance", moves, tempo_bpm=130, difficulty=2)
+        return _FREEZE_DANCE
 
     @staticmethod
-    def get_all_sequences() -> List[DanceSequence]:
+    def get_all_sequences() -> Tuple[DanceSequence, ...]:
         """Get all available dance sequences."""
-        return [
-            DanceLibrary.get_ymca(),
-            DanceLibrary.get_baby_shark(),
-            DanceLibrary.get_hokey_pokey(),
-            DanceLibrary.get_macarena(),
-            DanceLibrary.get_freeze_dance(),
-        ]
+        return _ALL_SEQUENCES
+
+
+@lru_cache(maxsize=64)
+def _scale_targets(move: DanceMove, screen_width: int, screen_height: int
+                   ) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+    """Float pixel targets for a move at a given screen size (moves are frozen, so memoizable)."""
+    left_target = None
+    right_target = None
+
+    if move.left_hand_target:
+        left_target = (
+            move.left_hand_target[0] * screen_width,
+            move.left_hand_target[1] * screen_height
+        )
+
+    if move.right_hand_target:
+        right_target = (
+            move.right_hand_target[0] * screen_width,
+            move.right_hand_target[1] * screen_height
+        )
+
+    return left_target, right_target
 
 
 class DanceTargetManager:
     """Manages the current dance sequence and target matching."""
 
     def __init__(self, screen_width: int, screen_height: int):
-        self.screen_width = screen_width
-        self.screen_height = screen_height
+        # Read through properties so a resize rescales the current move's targets
+        self._screen_width = screen_width
+        self._screen_height = screen_height
 
         # Current dance state
         self.current_sequence: Optional[DanceSequence] = None
@@ -161,11 +206,18 @@ class DanceTargetManager:
         self.move_timeout: float = 5.0  # Seconds to hit the target (kid-friendly)
 
         # Target hit detection
-        self.hit_radius: float = 80  # Pixels - reasonable radius for hitting targets
-        self.left_hand_hit: bool = False
-        self.right_hand_hit: bool = False
+        self._hit_radius_sq: float = 0.0
+        self.hit_radius = 80  # Pixels - reasonable radius for hitting targets
+        # Hit state as bits (LEFT_BIT | RIGHT_BIT); required bits are the tracked targets
+        self._hit_mask: int = 0
+        self._required_mask: int = 0
         self.left_hit_time: float = 0.0  # When left was hit
         self.right_hit_time: float = 0.0  # When right was hit
+        # Current move's targets in pixels, recomputed only when the move changes
+        self._cached_left_target: Optional[Tuple[int, int]] = None
+        self._cached_right_target: Optional[Tuple[int, int]] = None
+        # Same targets as a (left, right) array, NaN where untracked
+        self._targets_arr = np.full((2, 2), np.nan, dtype=np.float32)
 
         # Timing
         self.min_display_time: float = 3.0  # Minimum time to show targets
@@ -188,22 +240,51 @@ class DanceTargetManager:
         self.loop_count: int = 0
         self.max_loops: int = 2  # How many times to repeat the dance
 
+    @property
+    def screen_width(self) -> int:
+        """Screen width in pixels; setting it rescales the current targets."""
+        return self._screen_width
+
+    @screen_width.setter
+    def screen_width(self, width: int):
+        self._screen_width = width
+        self._recompute_targets()
+
+    @property
+    def screen_height(self) -> int:
+        """Screen height in pixels; setting it rescales the current targets."""
+        return self._screen_height
+
+    @screen_height.setter
+    def screen_height(self, height: int):
+        self._screen_height = height
+        self._recompute_targets()
+
+    @property
+    def hit_radius(self) -> float:
+        """Radius (pixels) within which a hand counts as hitting a target."""
+        return self._hit_radius
+
+    @hit_radius.setter
+    def hit_radius(self, radius: float):
+        self._hit_radius = radius
+        self._hit_radius_sq = radius * radius
+
     def start_sequence(self, sequence: DanceSequence):
         """Start a new dance sequence."""
         self.current_sequence = sequence
         self.current_move_index = 0
         self.move_timer = 0.0
-        self.left_hand_hit = False
-        self.right_hand_hit = False
+        self._hit_mask = 0
         self.moves_completed = 0
         self.moves_missed = 0
         self.current_streak = 0
         self.loop_count = 0
+        self._recompute_targets()
 
     def start_random_sequence(self):
         """Start a random dance sequence."""
-        sequences = DanceLibrary.get_all_sequences()
-        self.start_sequence(random.choice(sequences))
+        self.start_sequence(random.choice(_ALL_SEQUENCES))
 
     def get_current_move(self) -> Optional[DanceMove]:
         """Get the current dance move."""
@@ -211,58 +292,81 @@ class DanceTargetManager:
             return self.current_sequence.moves[self.current_move_index]
         return None
 
+    @property
+    def left_hand_hit(self) -> bool:
+        """Whether the left target has been hit this move."""
+        return bool(self._hit_mask & LEFT_BIT)
+
+    @property
+    def right_hand_hit(self) -> bool:
+        """Whether the right target has been hit this move."""
+        return bool(self._hit_mask & RIGHT_BIT)
+
     def get_target_positions(self) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
-        """Get current target positions in screen coordinates."""
+        """Get current target positions in integer screen coordinates (for drawing)."""
+        return self._cached_left_target, self._cached_right_target
+
+    def _compute_target_positions(self) -> Tuple[Optional[Tuple[float, float]],
+                                                 Optional[Tuple[float, float]]]:
+        """Scale the current move's normalized targets to screen pixels."""
         move = self.get_current_move()
         if not move:
             return None, None
+        return _scale_targets(move, self.screen_width, self.screen_height)
+
+    def _recompute_targets(self):
+        """Cache the current move's pixel targets (called when the move or screen size changes)."""
+        left_target, right_target = self._compute_target_positions()
+        self._cached_left_target = (int(left_target[0]), int(left_target[1])) if left_target else None
+        self._cached_right_target = (int(right_target[0]), int(right_target[1])) if right_target else None
+        self._required_mask = (LEFT_BIT if left_target else 0) | (RIGHT_BIT if right_target else 0)
+        nan = (np.nan, np.nan)
+        self._targets_arr = np.array([left_target or nan, right_target or nan],
+                                     dtype=np.float32)
+
+    def check_hands_hit(self, left_hand: Optional[Tuple[float, float]],
+                        right_hand: Optional[Tuple[float, float]]) -> np.ndarray:
+        """
+        Check both hands against their targets in one vectorized pass.
 
-        left_target = None
-        right_target = None
-
-        if move.left_hand_target:
-            left_target = (
-                int(move.left_hand_target[0] * self.screen_width),
-                int(move.left_hand_target[1] * self.screen_height)
-            )
-
-        if move.right_hand_target:
-            right_target = (
-                int(move.right_hand_target[0] * self.screen_width),
-                int(move.right_hand_target[1] * self.screen_height)
-            )
-
-        return left_target, right_target
+        Returns a bool array [left_hit, right_hit]. Missing hands or targets
+        are NaN, which never compare as a hit.
+        """
+        nan = (np.nan, np.nan)
+        hands = np.array([left_hand or nan, right_hand or nan], dtype=np.float32)
+        diff = hands - self._targets_arr
+        d2 = np.einsum('ij,ij->i', diff, diff)
+        return d2 <= self._hit_radius_sq
 
-    def check_hand_hit(self, hand_pos: Tuple[float, float], target_pos: Tuple[int, int]) -> bool:
+    def check_hand_hit(self, hand_pos: Tuple[float, float], target_pos: Tuple[float, float]) -> bool:
         """Check if a hand position is close enough to the target."""
         if not hand_pos or not target_pos:
             return False
 
         dx = hand_pos[0] - target_pos[0]
         dy = hand_pos[1] - target_pos[1]
-        distance = math.sqrt(dx * dx + dy * dy)
-
-        return distance <= self.hit_radius
+        return dx * dx + dy * dy <= self._hit_radius_sq
 
     def update(self, dt: float, left_hand: Optional[Tuple[float, float]],
-               right_hand: Optional[Tuple[float, float]]) -> Dict:
+               right_hand: Optional[Tuple[float, float]]) -> int:
         """
         Update the dance target system.
 
-        Returns dict with events: {'hit': bool, 'miss': bool, 'complete': bool, 'pop': bool}
+        Returns a bitmask of EVENT_* flags (0 when nothing happened), e.g.
+        `if events & EVENT_HIT: ...`
         """
-        events = {'hit': False, 'miss': False, 'complete': False, 'sequence_complete': False, 'pop': False}
+        events = 0
 
         if not self.current_sequence:
             return events
 
         # Update visual effects
-        self.target_pulse += dt * 3
+        # Pulse is a phase; wrap it so it never loses precision in long sessions
+        self.target_pulse = (self.target_pulse + dt * 3) % (2 * math.pi)
         if self.success_flash > 0:
-            self.success_flash -= dt * 2
+            self.success_flash = max(0.0, self.success_flash - dt * 2)
         if self.miss_flash > 0:
-            self.miss_flash -= dt * 2
+            self.miss_flash = max(0.0, self.miss_flash - dt * 2)
 
         # Update move timer
         self.move_timer += dt
@@ -273,35 +377,31 @@ class DanceTargetManager:
             if self.celebration_timer >= self.celebration_time:
                 # Celebration done, advance to next move
                 self._next_move()
-                events['complete'] = True
+                events |= EVENT_COMPLETE
             return events
 
-        # Get current targets
-        left_target, right_target = self.get_target_positions()
-
         # Check for hits
-        if left_target and not self.left_hand_hit:
-            if self.check_hand_hit(left_hand, left_target):
-                self.left_hand_hit = True
-                self.left_hit_time = self.move_timer
-                events['pop'] = True  # Trigger pop effect
+        left_hit, right_hit = self.check_hands_hit(left_hand, right_hand)
 
-        if right_target and not self.right_hand_hit:
-            if self.check_hand_hit(right_hand, right_target):
-                self.right_hand_hit = True
+        new_hits = (LEFT_BIT * bool(left_hit) | RIGHT_BIT * bool(right_hit)) \
+            & self._required_mask & ~self._hit_mask
+        if new_hits:
+            if new_hits & LEFT_BIT:
+                self.left_hit_time = self.move_timer
+            if new_hits & RIGHT_BIT:
                 self.right_hit_time = self.move_timer
-                events['pop'] = True  # Trigger pop effect
+            self._hit_mask |= new_hits
+            events |= EVENT_POP  # Trigger pop effect
 
         # Check if move is complete (all required targets hit)
-        left_done = (left_target is None) or self.left_hand_hit
-        right_done = (right_target is None) or self.right_hand_hit
+        all_done = (self._hit_mask & self._required_mask) == self._required_mask
 
         # Need minimum display time before advancing
         can_advance = self.move_timer >= self.min_display_time
 
-        if left_done and right_done and can_advance:
+        if all_done and can_advance:
             # Move completed successfully! Start celebration
-            events['hit'] = True
+            events |= EVENT_HIT
             self.moves_completed += 1
             self.current_streak += 1
             self.best_streak = max(self.best_streak, self.current_streak)
@@ -311,7 +411,7 @@ class DanceTargetManager:
 
         elif self.move_timer >= self.move_timeout:
             # Time's up - missed this move
-            events['miss'] = True
+            events |= EVENT_MISS
             self.moves_missed += 1
             self.current_streak = 0
             self.miss_flash = 1.0
@@ -321,10 +421,11 @@ class DanceTargetManager:
         if self.current_move_index >= len(self.current_sequence.moves):
             self.loop_count += 1
             if self.loop_count >= self.max_loops:
-                events['sequence_complete'] = True
+                events |= EVENT_SEQUENCE_COMPLETE
             else:
                 # Loop the sequence
                 self.current_move_index = 0
+                self._recompute_targets()
 
         return events
 
@@ -332,12 +433,12 @@ class DanceTargetManager:
         """Advance to the next move."""
         self.current_move_index += 1
         self.move_timer = 0.0
-        self.left_hand_hit = False
-        self.right_hand_hit = False
+        self._hit_mask = 0
         self.left_hit_time = 0.0
         self.right_hit_time = 0.0
         self.celebrating = False
         self.celebration_timer = 0.0
+        self._recompute_targets()
 
     def get_time_remaining(self) -> float:
         """Get time remaining for current move."""
@@ -115,7 +115,10 @@ class PlayerDetector:
         self.last_frame_rgb = None
 
         # Smoothing and stability
-        self.smooth_factor = 0.3  # Lower = more smoothing
+        self.smooth_factor = 0.3  # Lower = more smoothing, per smooth_interval
+        self.smooth_interval = 1 / 30  # Detection spacing smooth_factor is tuned for (s)
+        self._smooth_alpha = self.smooth_factor  # smooth_factor scaled to this detection
+        self._last_detection_ms = None
         self.previous_landmarks = {}  # Store previous positions for smoothing
         self.player_positions = []  # Track player positions for stable assignment
         self.frames_since_detection = {}  # Track how long since each player was seen
@@ -179,6 +182,10 @@ class PlayerDetector:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
 
+        # Keep only the newest frame queued so reads never return stale images
+        # (a no-op on backends that don't support it)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
         # Get actual resolution (camera might not support requested)
         self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -205,21 +212,48 @@ class PlayerDetector:
         Returns:
             List of PlayerLandmarks (currently supports single player)
         """
-        if self.cap is None or not self.cap.isOpened():
+        frame_rgb = self.read_frame()
+        if frame_rgb is None:
             return []
+        return self.detect_in_frame(frame_rgb, game_width, game_height)
+
+    def read_frame(self) -> Optional[np.ndarray]:
+        """
+        Capture the next webcam frame, mirrored, without running pose detection.
+
+        Returns:
+            The RGB frame (also kept as last_frame_rgb), or None if no frame was read
+        """
+        if self.cap is None or not self.cap.isOpened():
+            return None
 
         ret, frame = self.cap.read()
         if not ret:
-            return []
+            return None
 
-        # Mirror the frame so player sees themselves correctly
-        frame = cv2.flip(frame, 1)
+        # Mirror the frame so player sees themselves correctly (in place; the
+        # capture hands back a fresh buffer each read)
+        cv2.flip(frame, 1, dst=frame)
 
         # Convert BGR to RGB for MediaPipe
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         self.last_frame = frame
         self.last_frame_rgb = frame_rgb
+        return frame_rgb
 
+    def detect_in_frame(self, frame_rgb: np.ndarray, game_width: int,
+                        game_height: int) -> List[PlayerLandmarks]:
+        """
+        Run pose detection on a frame from read_frame().
+
+        Args:
+            frame_rgb: Mirrored RGB camera frame
+            game_width: Width of the game screen (for coordinate mapping)
+            game_height: Height of the game screen (for coordinate mapping)
+
+        Returns:
+            List of PlayerLandmarks, ordered left to right
+        """
         players = []
 
         if self.pose_landmarker is not None:
@@ -230,6 +264,13 @@ class PlayerDetector:
                 # Get timestamp in milliseconds
                 timestamp_ms = int(cv2.getTickCount() / cv2.getTickFrequency() * 1000)
 
+                # Keep the smoothing time constant whatever the detection rate:
+                # one detection twice as far apart blends like two at the tuned rate
+                if self._last_detection_ms is not None:
+                    steps = min((timestamp_ms - self._last_detection_ms) / 1000 / self.smooth_interval, 10.0)
+                    self._smooth_alpha = 1 - (1 - self.smooth_factor) ** steps
+                self._last_detection_ms = timestamp_ms
+
                 # Detect pose
                 result = self.pose_landmarker.detect_for_video(mp_image, timestamp_ms)
 
@@ -302,8 +343,8 @@ class PlayerDetector:
             key = f"p{player_idx}_{point_name}"
             if key in self.previous_landmarks:
                 prev_x, prev_y = self.previous_landmarks[key]
-                x = prev_x + (x - prev_x) * self.smooth_factor
-                y = prev_y + (y - prev_y) * self.smooth_factor
+                x = prev_x + (x - prev_x) * self._smooth_alpha
+                y = prev_y + (y - prev_y) * self._smooth_alpha
 
             self.previous_landmarks[key] = (x, y)
             return (x, y)